@@ -8,9 +8,19 @@ policy interventions.
 
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
+import numpy as np
+import altair as alt
 from pathlib import Path
-from stress_engine import calculate_stress_score, classify_risk
+from stress_engine import calculate_stress_score, classify_risk_codes, add_risk_level, RISK_LEVELS
+from simulation import precompute_stress_grid, simulate_waste_reduction, simulate_emission_control
+
+
+# Color used for each risk level in the metrics panel and both charts
+RISK_COLORS = {
+    'Low': 'green',
+    'Moderate': 'orange',
+    'High': 'red'
+}
 
 
 @st.cache_data
@@ -61,8 +71,10 @@ def load_data() -> pd.DataFrame:
         )
     
     try:
-        # Load the CSV file into a pandas DataFrame
-        df = pd.read_csv(csv_path)
+        # Load the CSV file into a pandas DataFrame using the multithreaded
+        # pyarrow parser (pyarrow is already required by Streamlit). Zone names
+        # are kept Arrow-backed so comparisons and hashing stay vectorized
+        df = pd.read_csv(csv_path, engine="pyarrow", dtype={'zone': 'string[pyarrow]'})
         
         # Validate that the dataframe is not empty
         if df.empty:
@@ -81,8 +93,9 @@ def load_data() -> pd.DataFrame:
         # This applies normalization and weighted formula to AQI, waste_index, and temperature
         df = calculate_stress_score(df)
         
-        # Classify risk levels for each zone based on stress scores
-        df['risk_level'] = df['stress_score'].apply(classify_risk)
+        # Classify risk levels for each zone based on stress scores (vectorized,
+        # categorical so value_counts() is a bincount over the codes)
+        df = add_risk_level(df)
         
         return df
         
@@ -92,6 +105,266 @@ def load_data() -> pd.DataFrame:
         raise Exception(f"Unexpected error loading data: {e}")
 
 
+def get_data_key(df: pd.DataFrame) -> int:
+    """
+    Return a content hash of the loaded data.
+    
+    Results derived from the data (the stress grid, simulated frames and the
+    session's last simulation) are keyed on it, so they are recomputed when the
+    data changes, e.g. after the CSV is regenerated and the cache cleared.
+    
+    Args:
+        df (pd.DataFrame): Output of load_data()
+        
+    Returns:
+        int: Hash of every value in the dataframe
+    """
+    return int(pd.util.hash_pandas_object(df, index=False).sum())
+
+
+@st.cache_resource(max_entries=4)
+def get_stress_grid(data_key: int) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Precompute stress scores and risk levels for every slider position.
+    
+    The sliders are integers in [0, 100], so the whole response surface is only
+    101 × 101 × (number of zones) values. It is computed once per process with
+    NumPy broadcasting and shared across sessions as a read-only resource.
+    
+    Args:
+        data_key (int): get_data_key() of the loaded data; only used to key the
+            cache so a grid is never reused for different data
+            
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (stress, risk_codes), both indexed as
+            [waste_reduction, emission_control, zone]. risk_codes index into
+            RISK_LEVELS (0 = Low, 1 = Moderate, 2 = High).
+    """
+    stress = precompute_stress_grid(load_data())
+    
+    risk_codes = classify_risk_codes(stress)
+    
+    return stress, risk_codes
+
+
+@st.cache_data(max_entries=256)
+def run_simulation(waste_reduction: int, emission_control: int, data_key: int) -> pd.DataFrame:
+    """
+    Apply the policy sliders to the loaded data and look up stress metrics.
+    
+    Stress scores and risk levels come straight from the precomputed grid in
+    get_stress_grid(), so a slider change is an array lookup rather than a pass
+    through the simulation and stress engine. The result is additionally cached
+    per (waste_reduction, emission_control, data_key).
+    
+    Args:
+        waste_reduction (int): Waste reduction percentage from the sidebar slider
+        emission_control (int): Emission control percentage from the sidebar slider
+        data_key (int): get_data_key() of the loaded data
+        
+    Returns:
+        pd.DataFrame: The loaded data with simulated AQI/waste_index values and
+                     updated stress_score and risk_level columns
+    """
+    df = load_data()
+    stress, risk_codes = get_stress_grid(data_key)
+    
+    # Reduce AQI and waste_index with the simulation functions themselves so the
+    # displayed values get the same non-negative clamp
+    simulated_df = simulate_emission_control(simulate_waste_reduction(df, waste_reduction), emission_control)
+    return simulated_df.assign(
+        stress_score=stress[waste_reduction, emission_control],
+        risk_level=pd.Categorical.from_codes(
+            risk_codes[waste_reduction, emission_control], categories=RISK_LEVELS, ordered=True
+        )
+    )
+
+
+@st.cache_resource
+def get_threshold_rules() -> alt.Chart:
+    """
+    Build the dashed risk-threshold lines for the stress score chart.
+    
+    The lines at 0.4 and 0.7 never change, so the layer is built once per
+    process and layered onto each freshly built bar chart.
+    
+    Returns:
+        alt.Chart: Rule layer with one horizontal line per threshold
+    """
+    return alt.Chart(pd.DataFrame({'threshold': [0.4, 0.7]})).mark_rule(
+        color='gray', strokeDash=[4, 4], opacity=0.5
+    ).encode(y='threshold:Q')
+
+
+def build_stress_bar_chart(simulated_df: pd.DataFrame) -> alt.LayerChart:
+    """
+    Build the "Stress Scores by Zone" bar chart for a simulated dataframe.
+    
+    Bars are sorted by stress score and colored by risk level, with dashed lines
+    marking the Moderate (0.4) and High (0.7) thresholds. The chart is a Vega-Lite
+    spec rendered client-side, so no image is rasterized on the server.
+    
+    Args:
+        simulated_df (pd.DataFrame): Output of run_simulation()
+        
+    Returns:
+        alt.LayerChart: The bar chart layered with the threshold lines
+    """
+    # Only ship the columns the chart actually encodes
+    chart_df = simulated_df[['zone', 'stress_score', 'risk_level']]
+    
+    # Bars sorted by stress score (descending) and colored by risk level
+    bars = alt.Chart(chart_df).mark_bar(opacity=0.7).encode(
+        x=alt.X('zone:N', sort='-y', title='Zone', axis=alt.Axis(labelAngle=-45)),
+        y=alt.Y('stress_score:Q', title='Stress Score', scale=alt.Scale(domain=[0, 1.0])),
+        color=alt.Color(
+            'risk_level:N',
+            scale=alt.Scale(domain=list(RISK_COLORS), range=list(RISK_COLORS.values())),
+            legend=None
+        ),
+        tooltip=['zone', 'stress_score', 'risk_level']
+    )
+    
+    # Add the (static, shared) horizontal lines at risk thresholds
+    return bars + get_threshold_rules()
+
+
+def build_risk_distribution_chart(simulated_df: pd.DataFrame) -> alt.LayerChart:
+    """
+    Build the "Risk Level Distribution" bar chart for a simulated dataframe.
+    
+    Args:
+        simulated_df (pd.DataFrame): Output of run_simulation()
+        
+    Returns:
+        alt.LayerChart: The bar chart layered with a count label on each bar
+    """
+    # Count risk levels
+    risk_counts = simulated_df['risk_level'].value_counts()
+    
+    # Ensure all risk levels are present (even if count is 0)
+    risk_levels = ['Low', 'Moderate', 'High']
+    risk_counts = risk_counts.reindex(risk_levels, fill_value=0)
+    counts_df = pd.DataFrame({'risk_level': risk_levels, 'count': risk_counts.to_numpy()})
+    
+    base = alt.Chart(counts_df).encode(
+        x=alt.X('risk_level:N', sort=risk_levels, title='Risk Level', axis=alt.Axis(labelAngle=0)),
+        y=alt.Y(
+            'count:Q',
+            title='Number of Zones',
+            scale=alt.Scale(domain=[0, max(10, int(risk_counts.max()) + 1)])
+        )
+    )
+    
+    # Create bar chart for risk distribution
+    bars = base.mark_bar(opacity=0.7).encode(
+        color=alt.Color(
+            'risk_level:N',
+            scale=alt.Scale(domain=list(RISK_COLORS), range=list(RISK_COLORS.values())),
+            legend=None
+        )
+    )
+    
+    # Add count labels on top of bars
+    labels = base.mark_text(dy=-8, fontSize=10, fontWeight='bold').encode(text='count:Q')
+    
+    return bars + labels
+
+
+def render_charts(simulated_df: pd.DataFrame) -> None:
+    """
+    Render the visualizations section for the simulated data.
+    
+    Args:
+        simulated_df (pd.DataFrame): Output of run_simulation()
+    """
+    # Visualizations
+    st.header("📈 Visualizations")
+    
+    # Create two columns for the charts
+    viz_col1, viz_col2 = st.columns(2)
+    
+    with viz_col1:
+        st.subheader("Stress Scores by Zone")
+        st.altair_chart(build_stress_bar_chart(simulated_df))
+    
+    with viz_col2:
+        st.subheader("Risk Level Distribution")
+        st.altair_chart(build_risk_distribution_chart(simulated_df))
+
+
+@st.cache_data(ttl=3600, max_entries=1024, show_spinner=False)
+def get_explanation(zone: str, aqi: float, waste: float, stress_score: float, risk_level: str) -> str:
+    """
+    Generate (or reuse) the natural language explanation for a zone's metrics.
+    
+    Wraps llm_explainer.generate_explanation() in a cache so that repeated
+    inputs do not trigger another LLM API call (which can take up to the
+    10-second timeout). Entries expire after an hour so explanations that fell
+    back to the template during an API outage are eventually retried.
+    
+    Args:
+        zone: Zone identifier (e.g., "Zone A")
+        aqi: Air Quality Index value
+        waste: Waste management index value
+        stress_score: Calculated stress score (0-1 range)
+        risk_level: Risk classification ("Low", "Moderate", or "High")
+        
+    Returns:
+        str: The explanation text
+    """
+    # Import explanation generator
+    from llm_explainer import generate_explanation
+    
+    return generate_explanation(zone, aqi, waste, stress_score, risk_level)
+
+
+def render_explanation(zone_data: dict) -> None:
+    """
+    Render the AI-powered explanation section for the selected zone.
+    
+    Args:
+        zone_data (dict): Simulated metrics for the selected zone, keyed by column
+    """
+    # AI Explanation Section
+    st.header("🤖 AI-Powered Explanation")
+    
+    # Display explanation in an expandable section
+    with st.expander("View Environmental Analysis", expanded=True):
+        # Show loading indicator while generating explanation
+        with st.spinner("Generating AI explanation..."):
+            try:
+                # Get the (cached) explanation for the selected zone. Inputs are
+                # rounded to the precision the explanation reports them at, so
+                # nearby slider positions share a cache entry
+                explanation = get_explanation(
+                    zone=zone_data['zone'],
+                    aqi=round(zone_data['AQI']),
+                    waste=round(zone_data['waste_index']),
+                    stress_score=round(zone_data['stress_score'], 2),
+                    risk_level=zone_data['risk_level']
+                )
+                
+                # Display the explanation
+                st.write(explanation)
+                
+            except Exception as e:
+                # Handle errors gracefully with fallback message
+                st.warning(
+                    f"Unable to generate AI explanation. "
+                    f"Showing basic analysis instead."
+                )
+                
+                # Provide a simple fallback message
+                fallback_msg = (
+                    f"{zone_data['zone']} has a {zone_data['risk_level']} risk level "
+                    f"with a stress score of {zone_data['stress_score']:.2f}. "
+                    f"The Air Quality Index is {zone_data['AQI']:.0f} and "
+                    f"waste management index is {zone_data['waste_index']:.0f}."
+                )
+                st.write(fallback_msg)
+
+
 def main():
     """
     Main application function that sets up the dashboard layout and handles user interactions.
@@ -147,32 +420,31 @@ def main():
         help="Percentage reduction in Air Quality Index (AQI) across all zones"
     )
     
-    # Apply simulations based on slider values
-    # Import simulation functions
-    from simulation import simulate_waste_reduction, simulate_emission_control, recalculate_stress
-    from llm_explainer import generate_explanation
-    
-    # Start with the original loaded data
-    simulated_df = df.copy()
-    
-    # Apply waste reduction if slider is not at 0
-    if waste_reduction > 0:
-        simulated_df = simulate_waste_reduction(simulated_df, waste_reduction)
-    
-    # Apply emission control if slider is not at 0
-    if emission_control > 0:
-        simulated_df = simulate_emission_control(simulated_df, emission_control)
-    
-    # Recalculate stress scores and risk levels after simulations
-    # This ensures the stress metrics reflect the modified environmental values
-    if waste_reduction > 0 or emission_control > 0:
-        simulated_df = recalculate_stress(simulated_df)
+    # Apply simulations based on slider values (cached per slider position).
+    # When only the zone selection changed, reuse this session's last result
+    # instead of going through the cache (which returns a fresh copy each time).
+    # The key includes the data's hash so a reload never shows stale results
+    data_key = get_data_key(df)
+    sim_key = (data_key, waste_reduction, emission_control)
+    if st.session_state.get('sim_key') == sim_key:
+        simulated_df = st.session_state['sim_df']
+        records = st.session_state['sim_records']
+    else:
+        simulated_df = run_simulation(waste_reduction, emission_control, data_key)
+        
+        # Convert once to plain dicts of Python scalars, one per zone keyed by
+        # zone name, so the metrics below never index into a Series
+        records = simulated_df.set_index('zone', drop=False).to_dict(orient='index')
+        
+        st.session_state['sim_key'] = sim_key
+        st.session_state['sim_df'] = simulated_df
+        st.session_state['sim_records'] = records
     
     # Display metrics for selected zone
     st.header(f"📊 {selected_zone} Metrics")
     
     # Get the data for the selected zone
-    zone_data = simulated_df[simulated_df['zone'] == selected_zone].iloc[0]
+    zone_data = records[selected_zone]
     
     # Create columns for metrics layout
     col1, col2, col3, col4 = st.columns(4)
@@ -217,130 +489,16 @@ def main():
         # Color code the risk level
         risk_level = zone_data['risk_level']
         
-        # Define color mapping for risk levels
-        risk_colors = {
-            'Low': 'green',
-            'Moderate': 'orange',
-            'High': 'red'
-        }
-        
         # Get the color for the current risk level
-        color = risk_colors.get(risk_level, 'gray')
+        color = RISK_COLORS.get(risk_level, 'gray')
         
         # Display risk level with color coding using markdown
         st.markdown(f"**Risk Level**")
         st.markdown(f":{color}[**{risk_level}**]")
     
-    # Visualizations
-    st.header("📈 Visualizations")
-    
-    # Create two columns for the charts
-    viz_col1, viz_col2 = st.columns(2)
-    
-    with viz_col1:
-        st.subheader("Stress Scores by Zone")
-        
-        # Create bar chart for stress scores
-        fig1, ax1 = plt.subplots(figsize=(8, 5))
-        
-        # Sort by stress score for better visualization
-        sorted_df = simulated_df.sort_values('stress_score', ascending=False)
-        
-        # Define colors based on risk levels
-        colors = []
-        for risk in sorted_df['risk_level']:
-            if risk == 'Low':
-                colors.append('green')
-            elif risk == 'Moderate':
-                colors.append('orange')
-            else:  # High
-                colors.append('red')
-        
-        # Create bar chart
-        ax1.bar(sorted_df['zone'], sorted_df['stress_score'], color=colors, alpha=0.7)
-        ax1.set_xlabel('Zone', fontsize=10)
-        ax1.set_ylabel('Stress Score', fontsize=10)
-        ax1.set_ylim(0, 1.0)
-        ax1.tick_params(axis='x', rotation=45, labelsize=9)
-        ax1.tick_params(axis='y', labelsize=9)
-        ax1.grid(axis='y', alpha=0.3)
-        
-        # Add a horizontal line at risk thresholds
-        ax1.axhline(y=0.4, color='gray', linestyle='--', linewidth=0.8, alpha=0.5)
-        ax1.axhline(y=0.7, color='gray', linestyle='--', linewidth=0.8, alpha=0.5)
-        
-        plt.tight_layout()
-        st.pyplot(fig1)
-        plt.close(fig1)
-    
-    with viz_col2:
-        st.subheader("Risk Level Distribution")
-        
-        # Count risk levels
-        risk_counts = simulated_df['risk_level'].value_counts()
-        
-        # Ensure all risk levels are present (even if count is 0)
-        risk_levels = ['Low', 'Moderate', 'High']
-        risk_counts = risk_counts.reindex(risk_levels, fill_value=0)
-        
-        # Create bar chart for risk distribution
-        fig2, ax2 = plt.subplots(figsize=(8, 5))
-        
-        # Define colors for risk levels
-        risk_colors_chart = ['green', 'orange', 'red']
-        
-        # Create bar chart
-        ax2.bar(risk_counts.index, risk_counts.values, color=risk_colors_chart, alpha=0.7)
-        ax2.set_xlabel('Risk Level', fontsize=10)
-        ax2.set_ylabel('Number of Zones', fontsize=10)
-        ax2.set_ylim(0, max(10, risk_counts.max() + 1))
-        ax2.tick_params(axis='x', labelsize=9)
-        ax2.tick_params(axis='y', labelsize=9)
-        ax2.grid(axis='y', alpha=0.3)
-        
-        # Add count labels on top of bars
-        for i, (level, count) in enumerate(risk_counts.items()):
-            ax2.text(i, count + 0.1, str(count), ha='center', va='bottom', fontsize=10, fontweight='bold')
-        
-        plt.tight_layout()
-        st.pyplot(fig2)
-        plt.close(fig2)
-    
-    # AI Explanation Section
-    st.header("🤖 AI-Powered Explanation")
-    
-    # Display explanation in an expandable section
-    with st.expander("View Environmental Analysis", expanded=True):
-        # Show loading indicator while generating explanation
-        with st.spinner("Generating AI explanation..."):
-            try:
-                # Call generate_explanation for the selected zone
-                explanation = generate_explanation(
-                    zone=zone_data['zone'],
-                    aqi=zone_data['AQI'],
-                    waste=zone_data['waste_index'],
-                    stress_score=zone_data['stress_score'],
-                    risk_level=zone_data['risk_level']
-                )
-                
-                # Display the explanation
-                st.write(explanation)
-                
-            except Exception as e:
-                # Handle errors gracefully with fallback message
-                st.warning(
-                    f"Unable to generate AI explanation. "
-                    f"Showing basic analysis instead."
-                )
-                
-                # Provide a simple fallback message
-                fallback_msg = (
-                    f"{zone_data['zone']} has a {zone_data['risk_level']} risk level "
-                    f"with a stress score of {zone_data['stress_score']:.2f}. "
-                    f"The Air Quality Index is {zone_data['AQI']:.0f} and "
-                    f"waste management index is {zone_data['waste_index']:.0f}."
-                )
-                st.write(fallback_msg)
+    # Visualizations and AI explanation
+    render_charts(simulated_df)
+    render_explanation(zone_data)
 
 
 if __name__ == "__main__":
@@ -5,9 +5,9 @@ Generates synthetic environmental data for 10 urban zones.
 Creates a CSV file with realistic varied environmental metrics.
 """
 
-import random
-import csv
 import os
+import numpy as np
+import pandas as pd
 
 
 def generate_city_environment_data():
@@ -20,7 +20,7 @@ def generate_city_environment_data():
     and humidity levels.
     
     Data Generation Strategy:
-    - Uses Python's random module to generate varied values within realistic ranges
+    - Uses a NumPy random Generator to draw each metric for all zones in one call
     - Each zone gets independent random values to simulate diverse urban conditions
     - Ranges are chosen to represent typical urban environmental conditions:
       * AQI (50-300): Covers "Moderate" to "Hazardous" air quality levels
@@ -45,48 +45,38 @@ def generate_city_environment_data():
     # This generates: ["Zone A", "Zone B", ..., "Zone J"]
     zones = [f"Zone {chr(65 + i)}" for i in range(10)]  # Zone A through Zone J
     
-    # Generate random environmental data for each zone
-    data = []
-    for zone in zones:
-        # Create a dictionary for each zone with randomized environmental metrics
-        row = {
-            'zone': zone,
-            # AQI range (50-300): Represents air pollution levels
-            # Lower values = better air quality, higher values = worse air quality
-            'AQI': random.randint(50, 300),
-            
-            # Waste index range (20-90): Represents waste management effectiveness
-            # Lower values = better waste management, higher values = more waste issues
-            'waste_index': random.randint(20, 90),
-            
-            # Temperature range (15-40°C): Represents ambient temperature
-            # Rounded to 1 decimal place for realistic precision
-            'temperature': round(random.uniform(15, 40), 1),
-            
-            # Humidity range (30-90%): Represents relative humidity
-            # Integer values are sufficient for humidity measurements
-            'humidity': random.randint(30, 90)
-        }
-        data.append(row)
+    num_zones = len(zones)
+    
+    # Generate random environmental data for all zones at once, one vectorized
+    # draw per metric (upper bounds are exclusive for integers, hence the +1)
+    rng = np.random.default_rng()
+    data = pd.DataFrame({
+        'zone': zones,
+        # AQI range (50-300): Represents air pollution levels
+        # Lower values = better air quality, higher values = worse air quality
+        'AQI': rng.integers(50, 301, size=num_zones),
+        
+        # Waste index range (20-90): Represents waste management effectiveness
+        # Lower values = better waste management, higher values = more waste issues
+        'waste_index': rng.integers(20, 91, size=num_zones),
+        
+        # Temperature range (15-40°C): Represents ambient temperature
+        # Rounded to 1 decimal place for realistic precision
+        'temperature': np.round(rng.uniform(15, 40, size=num_zones), 1),
+        
+        # Humidity range (30-90%): Represents relative humidity
+        # Integer values are sufficient for humidity measurements
+        'humidity': rng.integers(30, 91, size=num_zones)
+    })
     
     # Ensure the data directory exists before writing the file
     # exist_ok=True prevents errors if the directory already exists
     os.makedirs('data', exist_ok=True)
     
     # Write the generated data to a CSV file
+    # Column order: zone, AQI, waste_index, temperature, humidity
     csv_path = 'data/city_environment.csv'
-    with open(csv_path, 'w', newline='') as csvfile:
-        # Define the column order for the CSV file
-        fieldnames = ['zone', 'AQI', 'waste_index', 'temperature', 'humidity']
-        
-        # Create a CSV DictWriter to write dictionaries as CSV rows
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        
-        # Write the header row with column names
-        writer.writeheader()
-        
-        # Write all data rows
-        writer.writerows(data)
+    data.to_csv(csv_path, index=False)
     
     # Print confirmation messages
     print(f"✓ Generated environmental data for {len(data)} zones")
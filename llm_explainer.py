@@ -7,6 +7,7 @@ to template-based explanations.
 """
 
 import os
+from functools import lru_cache
 
 
 def generate_explanation(zone: str, aqi: float, waste: float, stress_score: float, risk_level: str) -> str:
@@ -55,11 +56,26 @@ def generate_explanation(zone: str, aqi: float, waste: float, stress_score: floa
     # Fallback template when API is unavailable or fails
     return _generate_fallback_explanation(zone, aqi, waste, stress_score, risk_level)
 
-def _call_gemini_api(zone: str, aqi: float, waste: float, stress_score: float, risk_level: str, api_key: str) -> str:
+
+@lru_cache(maxsize=4)
+def _get_gemini_model(api_key: str):
+    """Configure Gemini and build the model once per API key, reusing its connection."""
     import google.generativeai as genai
 
     genai.configure(api_key=api_key)
-    model = genai.GenerativeModel("gemini-1.5-flash")
+    return genai.GenerativeModel("gemini-1.5-flash")
+
+
+@lru_cache(maxsize=4)
+def _get_openai_client(api_key: str):
+    """Build the OpenAI client once per API key so its HTTP connection pool is reused."""
+    from openai import OpenAI
+
+    return OpenAI(api_key=api_key, timeout=10.0)
+
+
+def _call_gemini_api(zone: str, aqi: float, waste: float, stress_score: float, risk_level: str, api_key: str) -> str:
+    model = _get_gemini_model(api_key)
 
     prompt = f"""
     Analyze environmental stress for {zone}.
@@ -73,16 +89,19 @@ def _call_gemini_api(zone: str, aqi: float, waste: float, stress_score: float, r
     """
 
     response = model.generate_content(prompt)
-    return response.text
+    
+    # Fall back to the template if the model returned no text (e.g. an empty
+    # candidate), so callers always receive a non-empty string
+    if hasattr(response, "text") and response.text:
+        return response.text
+    return _generate_fallback_explanation(zone, aqi, waste, stress_score, risk_level)
 
 
 
 
 def _call_openai_api(zone: str, aqi: float, waste: float, stress_score: float, risk_level: str, api_key: str) -> str:
     """Call OpenAI API to generate explanation."""
-    from openai import OpenAI
-    
-    client = OpenAI(api_key=api_key, timeout=10.0)
+    client = _get_openai_client(api_key)
     
     prompt = f"""Analyze the environmental stress for {zone}:
 - Air Quality Index: {aqi}
@@ -5,6 +5,7 @@ This module provides policy intervention simulation functions for the Urban Envi
 Stress Simulator. It models waste reduction and emission control interventions.
 """
 
+import numpy as np
 import pandas as pd
 
 
@@ -49,21 +50,18 @@ def simulate_waste_reduction(df: pd.DataFrame, percent: float) -> pd.DataFrame:
         >>> result['waste_index'].tolist()
         [0.0, 0.0]
     """
-    # Create a copy to avoid modifying the original dataframe
-    df_copy = df.copy()
-    
     # Calculate the reduction factor: (1 - percent/100)
     # This converts percentage to a multiplier (e.g., 20% reduction → 0.8 multiplier)
     reduction_factor = 1 - (percent / 100)
     
-    # Apply the reduction to waste_index values
-    df_copy['waste_index'] = df_copy['waste_index'] * reduction_factor
-    
-    # Ensure non-negative values (though mathematically guaranteed with valid inputs)
-    # This is a safety measure for edge cases or floating-point precision issues
-    df_copy['waste_index'] = df_copy['waste_index'].clip(lower=0)
+    # Apply the reduction and clamp to non-negative values in one NumPy pass.
+    # The clamp is a safety measure for edge cases or floating-point precision issues
+    # (non-negativity is mathematically guaranteed with valid inputs)
+    new_values = np.maximum(df['waste_index'].to_numpy(dtype=np.float64) * reduction_factor, 0.0)
     
-    return df_copy
+    # Return a new dataframe with only this column replaced; the original
+    # dataframe is not modified and the other columns' data is not deep-copied
+    return df.assign(waste_index=new_values)
 
 
 def simulate_emission_control(df: pd.DataFrame, percent: float) -> pd.DataFrame:
@@ -108,24 +106,21 @@ def simulate_emission_control(df: pd.DataFrame, percent: float) -> pd.DataFrame:
         >>> result['AQI'].tolist()
         [0.0, 0.0]
     """
-    # Create a copy to avoid modifying the original dataframe
-    df_copy = df.copy()
-    
     # Calculate the reduction factor: (1 - percent/100)
     # This converts percentage to a multiplier (e.g., 20% reduction → 0.8 multiplier)
     reduction_factor = 1 - (percent / 100)
     
-    # Apply the reduction to AQI values
-    df_copy['AQI'] = df_copy['AQI'] * reduction_factor
+    # Apply the reduction and clamp to non-negative values in one NumPy pass.
+    # The clamp is a safety measure for edge cases or floating-point precision issues
+    # (non-negativity is mathematically guaranteed with valid inputs)
+    new_values = np.maximum(df['AQI'].to_numpy(dtype=np.float64) * reduction_factor, 0.0)
     
-    # Ensure non-negative values (though mathematically guaranteed with valid inputs)
-    # This is a safety measure for edge cases or floating-point precision issues
-    df_copy['AQI'] = df_copy['AQI'].clip(lower=0)
-    
-    return df_copy
+    # Return a new dataframe with only this column replaced; the original
+    # dataframe is not modified and the other columns' data is not deep-copied
+    return df.assign(AQI=new_values)
 
 
-def recalculate_stress(df: pd.DataFrame) -> pd.DataFrame:
+def recalculate_stress(df: pd.DataFrame, cache=None) -> pd.DataFrame:
     """
     Recalculate stress scores and risk levels for modified environmental data.
     
@@ -149,6 +144,8 @@ def recalculate_stress(df: pd.DataFrame) -> pd.DataFrame:
             - AQI: Air Quality Index values (possibly modified by simulation)
             - waste_index: Waste management metric values (possibly modified)
             - temperature: Temperature values in Celsius
+        cache (NormCache, optional): Passed through to calculate_stress_score()
+            so columns left unchanged by a simulation reuse their min/max.
             
     Returns:
         pd.DataFrame: The input dataframe with updated 'stress_score' and
@@ -168,14 +165,132 @@ def recalculate_stress(df: pd.DataFrame) -> pd.DataFrame:
         True
     """
     # Import stress_engine functions
-    from stress_engine import calculate_stress_score, classify_risk
+    from stress_engine import calculate_stress_score, add_risk_level
     
     # Recalculate stress scores using current environmental values
     # This uses the same normalization and weighting formula as initial calculation
-    df_with_scores = calculate_stress_score(df)
+    df_with_scores = calculate_stress_score(df, cache=cache)
     
-    # Apply risk classification to each stress score
+    # Classify all stress scores in one vectorized pass
     # This categorizes zones into Low, Moderate, or High risk levels
-    df_with_scores['risk_level'] = df_with_scores['stress_score'].apply(classify_risk)
+    return add_risk_level(df_with_scores)
+
+
+def apply_policies(df: pd.DataFrame, waste_pct: float, emission_pct: float) -> pd.DataFrame:
+    """
+    Apply both policy interventions and recalculate stress metrics in one pass.
+    
+    Fused equivalent of simulate_waste_reduction() → simulate_emission_control()
+    → recalculate_stress(). Instead of building an intermediate DataFrame at
+    each step, the reduced AQI and waste_index arrays, the stress scores and the
+    risk levels are computed directly on NumPy arrays and attached to a single
+    new dataframe.
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing at minimum the columns:
+            - AQI: Air Quality Index values
+            - waste_index: Waste management metric values
+            - temperature: Temperature values in Celsius
+        waste_pct (float): Waste reduction percentage in the range [0, 100]
+        emission_pct (float): Emission control (AQI reduction) percentage in the
+                             range [0, 100]
+                             
+    Returns:
+        pd.DataFrame: A new dataframe with reduced AQI and waste_index values and
+                     updated 'stress_score' and 'risk_level' columns. All other
+                     columns are preserved unchanged.
+                     
+    Examples:
+        >>> df = pd.DataFrame({
+        ...     'zone': ['Zone A', 'Zone B'],
+        ...     'AQI': [200, 150],
+        ...     'waste_index': [60, 40],
+        ...     'temperature': [30, 25]
+        ... })
+        >>> result = apply_policies(df, 20, 30)
+        >>> result['AQI'].tolist()
+        [140.0, 105.0]
+        >>> result['waste_index'].tolist()
+        [48.0, 32.0]
+    """
+    # Import stress_engine helpers
+    from stress_engine import _normalize_values, classify_risk_batch, STRESS_WEIGHTS
+    
+    # Same reductions (and non-negative clamp) as the individual simulate_* functions
+    aqi = np.maximum(df['AQI'].to_numpy(dtype=np.float64) * (1 - emission_pct / 100), 0.0)
+    waste = np.maximum(df['waste_index'].to_numpy(dtype=np.float64) * (1 - waste_pct / 100), 0.0)
+    temp = df['temperature'].to_numpy(dtype=np.float64)
+    
+    # Same normalization and weighted formula as calculate_stress_score()
+    stress_score = (
+        STRESS_WEIGHTS[0] * _normalize_values(aqi) +
+        STRESS_WEIGHTS[1] * _normalize_values(waste) +
+        STRESS_WEIGHTS[2] * _normalize_values(temp)
+    )
+    
+    return df.assign(
+        AQI=aqi,
+        waste_index=waste,
+        stress_score=stress_score,
+        risk_level=classify_risk_batch(stress_score)
+    )
+
+
+def precompute_stress_grid(df: pd.DataFrame, max_percent: int = 100) -> np.ndarray:
+    """
+    Precompute stress scores for every combination of integer policy settings.
+    
+    The dashboard sliders only take integer percentages in [0, max_percent], so
+    the full response surface is small enough to compute once up front. The
+    result is indexed as stress[waste_reduction, emission_control, zone], and
+    each slice matches what the simulate_* functions followed by
+    recalculate_stress() would produce for that slider position.
+    
+    The whole grid is built with NumPy broadcasting: AQI is scaled along the
+    emission-control axis, waste_index along the waste-reduction axis, and each
+    (waste_reduction, emission_control) scenario is min-max normalized across
+    zones before applying the weighted stress formula.
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing at minimum the columns:
+            - AQI: Air Quality Index values
+            - waste_index: Waste management metric values
+            - temperature: Temperature values in Celsius
+        max_percent (int): Largest slider percentage to precompute (default 100)
+        
+    Returns:
+        np.ndarray: Array of shape (max_percent + 1, max_percent + 1, len(df))
+                   with stress scores in the range [0, 1]
+                   
+    Examples:
+        >>> df = pd.DataFrame({
+        ...     'AQI': [100, 200],
+        ...     'waste_index': [30, 60],
+        ...     'temperature': [20, 30]
+        ... })
+        >>> grid = precompute_stress_grid(df)
+        >>> grid.shape
+        (101, 101, 2)
+    """
+    # Import the array normalization and weights shared with the stress engine
+    from stress_engine import _normalize_values, STRESS_WEIGHTS
+    
+    # Reduction factors (1 - percent/100) for every slider position
+    factors = 1 - np.arange(max_percent + 1, dtype=np.float64) / 100
+    
+    aqi = df['AQI'].to_numpy(dtype=np.float64)
+    waste = df['waste_index'].to_numpy(dtype=np.float64)
+    temp = df['temperature'].to_numpy(dtype=np.float64)
+    
+    # Emission control scales AQI along axis 1, waste reduction scales
+    # waste_index along axis 0; the zone axis is last. Clamped to non-negative
+    # values like the simulate_* functions
+    aqi_grid = np.maximum(aqi[None, None, :] * factors[None, :, None], 0.0)
+    waste_grid = np.maximum(waste[None, None, :] * factors[:, None, None], 0.0)
     
-    return df_with_scores
+    # Same normalization and weighted formula as calculate_stress_score()
+    return (
+        STRESS_WEIGHTS[0] * _normalize_values(aqi_grid) +
+        STRESS_WEIGHTS[1] * _normalize_values(waste_grid) +
+        STRESS_WEIGHTS[2] * _normalize_values(temp)
+    )
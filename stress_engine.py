@@ -5,8 +5,96 @@ This module provides core calculation functions for the Urban Environmental Stre
 It handles data normalization, stress score calculation, and risk classification.
 """
 
+import numpy as np
 import pandas as pd
 
+# Numba is optional: when installed, large frames use a compiled stress kernel
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Polars is optional: when installed, very large frames use its expression engine
+try:
+    import polars as pl
+    POLARS_AVAILABLE = True
+except ImportError:
+    POLARS_AVAILABLE = False
+
+
+# Risk level labels, indexed by the codes returned from classify_risk_codes()
+RISK_LEVELS = np.array(['Low', 'Moderate', 'High'], dtype=object)
+
+# Input columns of the stress formula and their weights (in the same order)
+STRESS_COLUMNS = ['AQI', 'waste_index', 'temperature']
+STRESS_WEIGHTS = np.array([0.5, 0.3, 0.2])
+
+# Minimum number of rows before calculate_stress_score() uses the Numba kernel;
+# below this the NumPy path is already faster than the parallel dispatch
+NUMBA_MIN_ROWS = 10_000
+
+# Frames with more rows than this are scored with Polars when it is installed
+POLARS_MIN_ROWS = 50_000
+
+
+if NUMBA_AVAILABLE:
+    # Every fast-math flag except nnan/ninf: the kernel must see NaN to skip it
+    @njit(parallel=True, cache=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+    def _stress_kernel(aqi, waste, temp, out):
+        """Compiled fused min-max normalize + weighted sum, writing scores into out."""
+        n = aqi.shape[0]
+        
+        # Parallel min/max reductions for all three factors in one pass. Missing
+        # (NaN) values are skipped like pandas' min()/max(); a factor with no
+        # valid values ends with min > max
+        a_min = np.inf
+        a_max = -np.inf
+        w_min = np.inf
+        w_max = -np.inf
+        t_min = np.inf
+        t_max = -np.inf
+        for i in prange(n):
+            a = aqi[i]
+            w = waste[i]
+            t = temp[i]
+            a_min = min(a_min, a if a == a else np.inf)
+            a_max = max(a_max, a if a == a else -np.inf)
+            w_min = min(w_min, w if w == w else np.inf)
+            w_max = max(w_max, w if w == w else -np.inf)
+            t_min = min(t_min, t if t == t else np.inf)
+            t_max = max(t_max, t if t == t else -np.inf)
+        
+        # Per-factor scale = weight / range, with zero-range factors contributing 0.
+        # The weights (STRESS_WEIGHTS) are literals so the kernel is specialized
+        # for them: each scale is folded to a scalar once per call and the loop
+        # body below reduces to three multiply-adds with no weight loads. Keep
+        # them in sync with STRESS_WEIGHTS (checked by the test suite)
+        a_inv = 0.5 / (a_max - a_min) if a_max != a_min else 0.0
+        w_inv = 0.3 / (w_max - w_min) if w_max != w_min else 0.0
+        t_inv = 0.2 / (t_max - t_min) if t_max != t_min else 0.0
+        
+        # A factor with no valid values is NaN for every row, as in the NumPy path
+        if a_min > a_max:
+            a_inv = np.nan
+        if w_min > w_max:
+            w_inv = np.nan
+        if t_min > t_max:
+            t_inv = np.nan
+        
+        # Second parallel pass writes the scores with no intermediate arrays.
+        # Constant factors contribute exactly 0 (even for a missing value), as
+        # normalize() maps them to zeros; the loop-invariant tests are hoisted
+        for i in prange(n):
+            score = 0.0
+            if a_inv != 0.0:
+                score += (aqi[i] - a_min) * a_inv
+            if w_inv != 0.0:
+                score += (waste[i] - w_min) * w_inv
+            if t_inv != 0.0:
+                score += (temp[i] - t_min) * t_inv
+            out[i] = score
+
 
 def normalize(series: pd.Series) -> pd.Series:
     """
@@ -21,6 +109,8 @@ def normalize(series: pd.Series) -> pd.Series:
     - When max == min (all values are identical), returns a series of zeros
       to avoid division by zero. This is appropriate because identical values
       have no variance and should all map to the same normalized value.
+    - Missing (NaN) values are ignored when finding the min and max and stay
+      NaN in the result; an empty series returns an empty series.
     
     Args:
         series (pd.Series): A pandas Series containing numeric values to normalize
@@ -41,20 +131,174 @@ def normalize(series: pd.Series) -> pd.Series:
         2    0.0
         dtype: float64
     """
-    min_val = series.min()
-    max_val = series.max()
+    # Normalize the underlying ndarray and wrap the result once; the identical-
+    # values case maps to zeros inside _normalize_values(). The result array is
+    # freshly allocated, so the Series can take ownership without the copy
+    # pandas makes by default under copy-on-write
+    values = series.to_numpy(dtype=np.float64)
+    return pd.Series(_normalize_values(values), index=series.index, name=series.name, copy=False)
+
+
+def _copy_on_write_enabled() -> bool:
+    """Return whether pandas' copy-on-write mode is active (always on in pandas 3)."""
+    if int(pd.__version__.split('.')[0]) >= 3:
+        return True
+    try:
+        return pd.get_option('mode.copy_on_write') is True
+    except KeyError:
+        # pandas before 1.5 has no copy-on-write mode
+        return False
+
+
+class NormCache:
+    """
+    Cache of per-column (min, max) statistics for calculate_stress_score().
+    
+    Entries are keyed by the identity of a column's data buffer (address, size,
+    dtype and strides). The simulate_* functions replace only the column they
+    change with a newly allocated array, so after a slider change the modified
+    column misses the cache while the untouched columns reuse their statistics.
+    
+    Only plain NumPy-backed columns whose to_numpy() is a view of the column's
+    own buffer are cached. Nullable and Arrow columns (Float64, Int64,
+    float64[pyarrow], ...) convert through a temporary copy whose address can
+    be reused by the next column, so their statistics are always recomputed.
     
-    # Handle edge case: when all values are identical (max == min)
-    if max_val == min_val:
-        return pd.Series([0.0] * len(series), index=series.index)
+    Each entry keeps the column's Series and ndarray, so the buffer cannot be
+    freed and its address reused by unrelated data. In-place edits (e.g.
+    df.loc[0, 'AQI'] = 500) are detected in both pandas modes:
     
-    # Apply Min-Max normalization formula
-    normalized = (series - min_val) / (max_val - min_val)
+    - With copy-on-write (pandas 3, or mode.copy_on_write in pandas 2) the held
+      Series makes pandas give the edited dataframe a fresh buffer, so the
+      lookup misses.
+    - Without it, the entry also stores a private copy of the data and a hit
+      is only used if the column still equals that copy.
     
+    Without copy-on-write, DataFrame.assign() copies every column, so the
+    simulate_* results do not share buffers with their input and nothing is
+    reused across slider changes. The cache holds at most maxsize entries,
+    evicting the oldest first.
+    
+    Examples:
+        >>> cache = NormCache()
+        >>> result = calculate_stress_score(df, cache=cache)
+    """
+    
+    def __init__(self, maxsize: int = 32):
+        self._cache = {}
+        self._maxsize = maxsize
+    
+    def __len__(self) -> int:
+        return len(self._cache)
+    
+    def minmax(self, series: pd.Series) -> tuple:
+        """Return (min, max) of a column, skipping NaN, computing it only on a cache miss."""
+        values = series.to_numpy()
+        
+        # Temporary conversions (nullable/Arrow columns) must not be cached
+        if not isinstance(series.dtype, np.dtype) or not np.shares_memory(values, np.asarray(series.array)):
+            values = series.to_numpy(dtype=np.float64, na_value=np.nan)
+            return (np.nanmin(values), np.nanmax(values))
+        
+        key = (values.ctypes.data, values.size, values.dtype.str, values.strides)
+        entry = self._cache.get(key)
+        if entry is not None:
+            snapshot = entry[2]
+            if snapshot is None or np.array_equal(snapshot, values, equal_nan=True):
+                return entry[3]
+            # Edited in place without copy-on-write: drop the stale entry
+            del self._cache[key]
+        
+        stats = (np.nanmin(values), np.nanmax(values))
+        if len(self._cache) >= self._maxsize:
+            # Evict the oldest entry (dicts preserve insertion order)
+            del self._cache[next(iter(self._cache))]
+        # Holding the Series (not just the ndarray view) registers a
+        # copy-on-write reference on the dataframe's data
+        snapshot = None if _copy_on_write_enabled() else values.copy()
+        self._cache[key] = (series, values, snapshot, stats)
+        return stats
+
+
+def _normalize_values(values: np.ndarray) -> np.ndarray:
+    """
+    Min-Max normalize a float array along its last axis.
+    
+    NumPy counterpart of normalize() used on the calculation hot paths. Each
+    1-D slice along the last axis is scaled independently, so the same helper
+    handles a single column or a whole grid of scenarios. Slices whose values
+    are all identical map to zeros, matching normalize(). Missing (NaN) values
+    are skipped when finding the min/max and stay NaN in the result, except in
+    an identical-values slice, which is all zeros.
+    
+    Args:
+        values (np.ndarray): Float array to normalize
+        
+    Returns:
+        np.ndarray: A new float64 array of the same shape with values in [0, 1]
+    """
+    # Empty slices have nothing to normalize (and no min/max)
+    if values.shape[-1] == 0:
+        return np.zeros(values.shape)
+    
+    min_val = np.nanmin(values, axis=-1, keepdims=True)
+    value_range = np.nanmax(values, axis=-1, keepdims=True) - min_val
+    
+    # Subtract into one new float64 buffer, then divide it in place wherever
+    # the range is non-zero
+    normalized = np.subtract(values, min_val, dtype=np.float64)
+    np.divide(normalized, value_range, out=normalized, where=value_range != 0)
+    
+    # Identical-values slices already hold value - min == 0 apart from missing
+    # values, which the zero fill also covers
+    constant = value_range == 0
+    if constant.any():
+        np.copyto(normalized, 0.0, where=constant)
     return normalized
 
 
-def calculate_stress_score(df: pd.DataFrame) -> pd.DataFrame:
+def _stress_scale(min_vals: np.ndarray, max_vals: np.ndarray) -> np.ndarray:
+    """
+    Return the per-factor scale (weight / range) for the weighted stress formula.
+    
+    Folding normalization and weighting into one scale per factor turns
+    stress_score = Σ weight × (value - min) / (max - min) into a single
+    matrix-vector product. Factors whose values are all identical get a scale
+    of 0, matching normalize()'s zeros for that edge case. The result has
+    min_vals' dtype.
+    """
+    # Weights: AQI (50%), waste (30%), temperature (20%)
+    value_range = max_vals - min_vals
+    return np.divide(
+        STRESS_WEIGHTS.astype(min_vals.dtype), value_range,
+        out=np.zeros(3, dtype=min_vals.dtype),
+        where=value_range != 0
+    )
+
+
+def _weighted_stress(cols: np.ndarray, min_vals: np.ndarray, scale: np.ndarray) -> np.ndarray:
+    """
+    Combine an (n, 3) block of AQI, waste_index and temperature into stress scores.
+    
+    Shared by calculate_stress_score(), apply_stress_score() and StressFrame.
+    min_vals and scale (see _stress_scale()) are passed in so callers can reuse
+    precomputed or cached statistics. A row with a missing (NaN) value scores
+    NaN, except in a constant factor, which contributes 0 as in normalize().
+    """
+    # The (n, 3) block from pandas is column-major; centre it into a C-ordered
+    # array so the gemv reads each row's three factors from contiguous memory.
+    # The fused scale replaces a separate normalized matrix N followed by
+    # N @ STRESS_WEIGHTS, saving one full (n, 3) temporary
+    centered = np.subtract(cols, min_vals, order='C')
+    if not scale.all():
+        # Zero the constant factors so a missing value there does not turn the
+        # row NaN through 0 × NaN
+        centered[:, scale == 0] = 0.0
+    return centered @ scale
+
+
+def calculate_stress_score(df: pd.DataFrame, cache: "NormCache | None" = None,
+                           dtype=np.float64) -> pd.DataFrame:
     """
     Calculate composite environmental stress scores for urban zones.
     
@@ -79,6 +323,14 @@ def calculate_stress_score(df: pd.DataFrame) -> pd.DataFrame:
             - AQI: Air Quality Index values
             - waste_index: Waste management metric values
             - temperature: Temperature values in Celsius
+        cache (NormCache, optional): Reuses per-column min/max statistics for
+            columns whose data has not changed since a previous call (e.g. the
+            untouched columns after a single slider change). When given, the
+            NumPy path is always used.
+        dtype (optional): Floating dtype for the calculation and the output
+            column. Defaults to float64; np.float32 halves memory traffic on
+            large frames at about 7 significant digits, ample for the 0.4/0.7
+            risk thresholds. Non-float64 dtypes always use the NumPy path.
             
     Returns:
         pd.DataFrame: The input dataframe with an added 'stress_score' column
@@ -98,23 +350,204 @@ def calculate_stress_score(df: pd.DataFrame) -> pd.DataFrame:
         >>> 0 <= result['stress_score'].min() <= result['stress_score'].max() <= 1
         True
     """
-    # Create a copy to avoid modifying the original dataframe
-    df_copy = df.copy()
+    dtype = np.dtype(dtype)
     
-    # Normalize each environmental factor to [0, 1] range
-    aqi_normalized = normalize(df_copy['AQI'])
-    waste_normalized = normalize(df_copy['waste_index'])
-    temp_normalized = normalize(df_copy['temperature'])
+    # No zones: nothing to normalize (and the reductions below have no identity)
+    if len(df) == 0:
+        return df.assign(stress_score=np.zeros(0, dtype=dtype))
     
-    # Apply weighted formula to calculate composite stress score
-    # Weights: AQI (50%), waste (30%), temperature (20%)
-    df_copy['stress_score'] = (
-        0.5 * aqi_normalized +
-        0.3 * waste_normalized +
-        0.2 * temp_normalized
+    use_fast_paths = cache is None and dtype == np.float64
+    
+    # Very large frames: evaluate the whole formula in Polars' multithreaded engine
+    if use_fast_paths and POLARS_AVAILABLE and len(df) > POLARS_MIN_ROWS:
+        return calculate_stress_score_polars(df)
+    
+    # Large frames: reduce, normalize and combine inside one compiled parallel
+    # kernel that writes straight into the output array
+    if use_fast_paths and NUMBA_AVAILABLE and len(df) >= NUMBA_MIN_ROWS:
+        stress_score = np.empty(len(df))
+        _stress_kernel(
+            df['AQI'].to_numpy(dtype=np.float64),
+            df['waste_index'].to_numpy(dtype=np.float64),
+            df['temperature'].to_numpy(dtype=np.float64),
+            stress_score
+        )
+        return df.assign(stress_score=stress_score)
+    
+    # Extract the three environmental factors as one (n, 3) block and take the
+    # per-factor min/max in a single reduction each. The reductions skip missing
+    # (NaN) values like pandas' min()/max(), so a missing reading only affects
+    # its own row
+    cols = df[STRESS_COLUMNS].to_numpy(dtype=dtype)
+    if cache is None:
+        min_vals = np.nanmin(cols, axis=0)
+        max_vals = np.nanmax(cols, axis=0)
+    else:
+        # Look up each column's stored data so unchanged columns hit the cache
+        stats = np.array([cache.minmax(df[column]) for column in STRESS_COLUMNS], dtype=dtype)
+        min_vals = stats[:, 0]
+        max_vals = stats[:, 1]
+    
+    # Every factor constant (e.g. a single-row frame): every normalized value is
+    # 0, so skip the centring and matrix product
+    if np.array_equal(min_vals, max_vals):
+        return df.assign(stress_score=np.zeros(len(df), dtype=dtype))
+    
+    stress_score = _weighted_stress(cols, min_vals, _stress_scale(min_vals, max_vals))
+    
+    # Return a new dataframe with the added column. assign() does not deep-copy
+    # the existing columns, and the original dataframe is not modified
+    return df.assign(stress_score=stress_score)
+
+
+def precompute_norm_params(df: pd.DataFrame, dtype=np.float64) -> tuple:
+    """
+    Compute the normalization parameters of calculate_stress_score() once.
+    
+    Returns the per-factor minimum and the fused scale (weight / range) for
+    AQI, waste_index and temperature. Pass them to apply_stress_score() to
+    score this or other frames without re-scanning for min/max, e.g. to
+    score new readings against a fixed reference frame.
+    
+    Args:
+        df (pd.DataFrame): Reference data with AQI, waste_index and temperature
+        dtype (optional): Floating dtype of the parameters and of the scores
+            produced from them. Defaults to float64.
+            
+    Returns:
+        tuple: (min_vals, scale), each a length-3 array in STRESS_COLUMNS order
+        
+    Examples:
+        >>> params = precompute_norm_params(df)
+        >>> result = apply_stress_score(df, params)  # same as calculate_stress_score(df)
+    """
+    cols = df[STRESS_COLUMNS].to_numpy(dtype=dtype)
+    min_vals = np.nanmin(cols, axis=0)
+    return min_vals, _stress_scale(min_vals, np.nanmax(cols, axis=0))
+
+
+def apply_stress_score(df: pd.DataFrame, params: tuple) -> pd.DataFrame:
+    """
+    Score a dataframe using parameters from precompute_norm_params().
+    
+    Only the centring and the weighted sum are performed. When params come
+    from a different frame, scores outside that frame's ranges fall outside
+    [0, 1].
+    
+    Args:
+        df (pd.DataFrame): Data with AQI, waste_index and temperature columns
+        params (tuple): (min_vals, scale) from precompute_norm_params()
+        
+    Returns:
+        pd.DataFrame: The input dataframe with an added 'stress_score' column.
+                     The original dataframe is not modified.
+    """
+    min_vals, scale = params
+    cols = df[STRESS_COLUMNS].to_numpy(dtype=scale.dtype)
+    return df.assign(stress_score=_weighted_stress(cols, min_vals, scale))
+
+
+def calculate_stress_score_batch(tensor: np.ndarray, weights=STRESS_WEIGHTS) -> np.ndarray:
+    """
+    Calculate stress scores for many snapshots of the zones in one call.
+    
+    Batch counterpart of calculate_stress_score() for scenario sweeps or
+    Monte-Carlo samples: each snapshot is min-max normalized across its zones
+    and combined with the weights, using one reduction over the whole tensor
+    instead of one Python call per snapshot.
+    
+    Args:
+        tensor (np.ndarray): Array of shape (S, N, 3) holding S snapshots of N
+            zones, with the factors in STRESS_COLUMNS order (AQI, waste_index,
+            temperature). Floating tensors keep their dtype; others are
+            computed in float64.
+        weights: Length-3 factor weights (default STRESS_WEIGHTS)
+        
+    Returns:
+        np.ndarray: Stress scores of shape (S, N) in the range [0, 1] for the
+                   default weights
+                   
+    Examples:
+        >>> tensor = np.stack([df[STRESS_COLUMNS].to_numpy() for df in scenarios])
+        >>> scores = calculate_stress_score_batch(tensor)
+        >>> scores.shape
+        (len(scenarios), len(scenarios[0]))
+    """
+    tensor = np.asarray(tensor)
+    if tensor.dtype.kind != 'f':
+        tensor = tensor.astype(np.float64)
+    if tensor.shape[1] == 0:
+        return np.zeros(tensor.shape[:2], dtype=tensor.dtype)
+    
+    # Per-snapshot, per-factor min/max across the zone axis, skipping NaN
+    min_vals = np.nanmin(tensor, axis=1, keepdims=True)
+    value_range = np.nanmax(tensor, axis=1, keepdims=True) - min_vals
+    
+    # Fused weight / range scale as in _stress_scale(), one row per snapshot
+    scale = np.divide(
+        np.asarray(weights, dtype=tensor.dtype), value_range,
+        out=np.zeros(value_range.shape, dtype=tensor.dtype),
+        where=value_range != 0
     )
     
-    return df_copy
+    # Constant factors contribute 0 even for missing values, as in _weighted_stress()
+    centered = tensor - min_vals
+    np.copyto(centered, 0.0, where=scale == 0)
+    
+    # (S, N, 3) @ (S, 3, 1) -> (S, N, 1): one batched matrix-vector product
+    return np.matmul(centered, scale.transpose(0, 2, 1))[..., 0]
+
+
+def calculate_stress_score_polars(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Polars implementation of calculate_stress_score() for large dataframes.
+    
+    Only the three input columns are handed to Polars; the min-max
+    normalization and weighted sum are expressed as a single lazy query that
+    Polars evaluates in one multithreaded pass without intermediate Python
+    objects. The resulting scores are attached to the original pandas frame,
+    so its index and other columns are untouched. calculate_stress_score()
+    dispatches here automatically for frames larger than POLARS_MIN_ROWS.
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing at minimum the columns:
+            - AQI: Air Quality Index values
+            - waste_index: Waste management metric values
+            - temperature: Temperature values in Celsius
+            
+    Returns:
+        pd.DataFrame: The input dataframe with an added 'stress_score' column,
+                     identical (up to floating-point rounding) to
+                     calculate_stress_score()
+                     
+    Raises:
+        ImportError: If polars is not installed
+    """
+    if not POLARS_AVAILABLE:
+        raise ImportError("calculate_stress_score_polars requires polars: pip install polars")
+    
+    # Weighted normalized term per factor; identical values contribute 0. NaN
+    # arrives as null (from_pandas' default), which min()/max() skip like
+    # pandas does, and a factor with no valid values stays null throughout
+    terms = []
+    for column, weight in zip(STRESS_COLUMNS, STRESS_WEIGHTS):
+        value = pl.col(column).cast(pl.Float64)
+        value_range = value.max() - value.min()
+        terms.append(
+            pl.when(value_range == 0)
+            .then(0.0)
+            .otherwise((value - value.min()) / value_range) * weight
+        )
+    
+    # ignore_nulls=False so a row with a missing value scores null (NaN below)
+    # instead of summing only its remaining factors
+    scores = (
+        pl.from_pandas(df[STRESS_COLUMNS]).lazy()
+        .select(pl.sum_horizontal(terms, ignore_nulls=False).alias('stress_score'))
+        .collect()
+    )
+    
+    return df.assign(stress_score=scores['stress_score'].to_numpy())
 
 
 def classify_risk(score: float) -> str:
@@ -156,3 +589,164 @@ def classify_risk(score: float) -> str:
         return "Moderate"
     else:
         return "High"
+
+
+def classify_risk_codes(scores) -> np.ndarray:
+    """
+    Vectorized risk classification returning integer codes.
+    
+    Applies the same thresholds as classify_risk() to a whole array of stress
+    scores in one pass: 0 = Low (score < 0.4), 1 = Moderate (0.4 ≤ score ≤ 0.7),
+    2 = High (score > 0.7). The codes index into RISK_LEVELS. The comparisons
+    are the same ones classify_risk() makes, so a missing (NaN) score is also
+    High: it is neither below 0.4 nor at most 0.7.
+    
+    Args:
+        scores: Array-like of stress scores (any shape)
+        
+    Returns:
+        np.ndarray: int8 array of risk codes with the same shape as scores
+        
+    Examples:
+        >>> classify_risk_codes([0.2, 0.4, 0.7, 0.8])
+        array([0, 1, 1, 2], dtype=int8)
+    """
+    scores = np.asarray(scores, dtype=np.float64)
+    
+    # Branchless: start every code at High and step down once for each of
+    # classify_risk()'s tests the score passes (< 0.4, <= 0.7). Both masks are
+    # subtracted in place from the preallocated int8 output
+    codes = np.full(scores.shape, 2, dtype=np.int8)
+    codes -= scores < 0.4
+    codes -= scores <= 0.7
+    return codes
+
+
+def classify_risk_batch(scores) -> pd.Categorical:
+    """
+    Classify a batch of stress scores into a risk-level Categorical.
+    
+    Array counterpart of classify_risk() for callers that do not hold a
+    Series: the codes from classify_risk_codes() become an ordered Categorical
+    (Low < Moderate < High) in one call, without a Python call per score.
+    
+    Args:
+        scores: 1-D array-like of stress scores in the range [0, 1]
+        
+    Returns:
+        pd.Categorical: "Low", "Moderate", or "High" for each score
+        
+    Examples:
+        >>> classify_risk_batch([0.2, 0.4, 0.7, 0.8]).tolist()
+        ['Low', 'Moderate', 'Moderate', 'High']
+    """
+    return pd.Categorical.from_codes(classify_risk_codes(scores), categories=RISK_LEVELS, ordered=True)
+
+
+def classify_risk_series(scores: pd.Series) -> pd.Series:
+    """
+    Classify a whole Series of stress scores into risk levels.
+    
+    Vectorized equivalent of scores.apply(classify_risk): the thresholds are
+    evaluated with NumPy comparisons instead of a Python call per row. The
+    result is an ordered categorical (Low < Moderate < High) backed by int8
+    codes rather than one Python string per row, so downstream
+    isin/groupby/value_counts work on integer codes. Equality with the plain
+    label strings works as before, and ordered comparisons such as
+    >= 'Moderate' are also supported.
+    
+    Args:
+        scores (pd.Series): Stress scores in the range [0, 1]
+        
+    Returns:
+        pd.Series: Categorical "Low", "Moderate", or "High" for each score,
+                  aligned to the input index
+                  
+    Examples:
+        >>> classify_risk_series(pd.Series([0.2, 0.5, 0.9])).tolist()
+        ['Low', 'Moderate', 'High']
+    """
+    return pd.Series(classify_risk_batch(scores.to_numpy()), index=scores.index, name=scores.name)
+
+
+def add_risk_level(df: pd.DataFrame, col: str = 'stress_score', out: str = 'risk_level') -> pd.DataFrame:
+    """
+    Return df with a risk-level column classified from a stress-score column.
+    
+    Use this instead of df[col].apply(classify_risk): the whole column is
+    classified in one vectorized pass and stored as an ordered categorical
+    (see classify_risk_series()).
+    
+    Args:
+        df (pd.DataFrame): DataFrame containing the stress-score column
+        col (str): Name of the stress-score column. Defaults to 'stress_score'.
+        out (str): Name of the risk-level column to add or replace.
+            Defaults to 'risk_level'.
+            
+    Returns:
+        pd.DataFrame: A new dataframe with the risk-level column. The original
+                     dataframe is not modified.
+                     
+    Examples:
+        >>> df = calculate_stress_score(df)
+        >>> df = add_risk_level(df)
+        >>> df['risk_level'].isin(['Low', 'Moderate', 'High']).all()
+        True
+    """
+    return df.assign(**{out: classify_risk_batch(df[col].to_numpy())})
+
+
+class StressFrame:
+    """
+    Zone data held as one contiguous (n, 3) block for repeated simulation.
+    
+    The AQI, waste_index and temperature columns are copied once into a
+    C-ordered array (columns in STRESS_COLUMNS order). The policy methods then
+    scale a column of that block in place instead of building a new DataFrame
+    per step, and stress_scores() works on the block directly. Use to_frame()
+    to get back to pandas for display.
+    
+    Defaults to float32, which halves memory traffic and is ample precision for
+    the 0.4/0.7 risk thresholds; pass dtype=np.float64 for the exact scores of
+    calculate_stress_score().
+    
+    Examples:
+        >>> frame = StressFrame(df)
+        >>> frame.reduce_waste(20)
+        >>> frame.reduce_emissions(10)
+        >>> scores = frame.stress_scores()
+    """
+    
+    __slots__ = ('cols', 'zones')
+    
+    def __init__(self, df: pd.DataFrame, dtype=np.float32):
+        self.cols = np.ascontiguousarray(df[STRESS_COLUMNS].to_numpy(dtype=dtype))
+        self.zones = df['zone'].to_numpy() if 'zone' in df.columns else None
+    
+    def _reduce(self, column: int, percent: float) -> None:
+        # Same multiplier and non-negative clamp as the simulate_* functions
+        values = self.cols[:, column]
+        values *= 1 - (percent / 100)
+        np.maximum(values, 0, out=values)
+    
+    def reduce_emissions(self, percent: float) -> None:
+        """Reduce AQI by percent in place (see simulate_emission_control())."""
+        self._reduce(0, percent)
+    
+    def reduce_waste(self, percent: float) -> None:
+        """Reduce waste_index by percent in place (see simulate_waste_reduction())."""
+        self._reduce(1, percent)
+    
+    def stress_scores(self) -> np.ndarray:
+        """Return the stress score of every zone for the current values."""
+        min_vals = np.nanmin(self.cols, axis=0)
+        return _weighted_stress(self.cols, min_vals, _stress_scale(min_vals, np.nanmax(self.cols, axis=0)))
+    
+    def to_frame(self) -> pd.DataFrame:
+        """Return the current values, stress scores and risk levels as a DataFrame."""
+        df = pd.DataFrame(self.cols, columns=STRESS_COLUMNS)
+        if self.zones is not None:
+            df.insert(0, 'zone', self.zones)
+        df['stress_score'] = self.stress_scores()
+        df['risk_level'] = classify_risk_series(df['stress_score'])
+        return df
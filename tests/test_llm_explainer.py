@@ -9,7 +9,7 @@ import os
 import pytest
 from unittest.mock import patch, MagicMock
 from hypothesis import given, strategies as st
-from llm_explainer import generate_explanation
+from llm_explainer import generate_explanation, _call_gemini_api, _get_gemini_model, _get_openai_client
 
 # Check if optional API libraries are available
 try:
@@ -25,6 +25,16 @@ except ImportError:
     OPENAI_AVAILABLE = False
 
 
+@pytest.fixture(autouse=True)
+def clear_client_caches():
+    """Reset cached API clients so each test sees its own mocks."""
+    _get_gemini_model.cache_clear()
+    _get_openai_client.cache_clear()
+    yield
+    _get_gemini_model.cache_clear()
+    _get_openai_client.cache_clear()
+
+
 class TestGenerateExplanation:
     """Unit tests for generate_explanation function."""
     
@@ -98,6 +108,33 @@ class TestGenerateExplanation:
             assert "Zone A" in result
             assert "Moderate" in result
     
+    @pytest.mark.skipif(not GEMINI_AVAILABLE, reason="google-generativeai not installed")
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_gemini_call_returns_string(self, mock_model_class, mock_configure):
+        """Test that _call_gemini_api returns the response text as a string."""
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value.text = "Zone A needs attention."
+        mock_model_class.return_value = mock_model
+        
+        result = _call_gemini_api("Zone A", 150, 45, 0.55, "Moderate", "test_key")
+        
+        assert result == "Zone A needs attention."
+    
+    @pytest.mark.skipif(not GEMINI_AVAILABLE, reason="google-generativeai not installed")
+    @patch('google.generativeai.configure')
+    @patch('google.generativeai.GenerativeModel')
+    def test_gemini_empty_response_fallback(self, mock_model_class, mock_configure):
+        """Test that an empty Gemini response falls back to the template."""
+        mock_model = MagicMock()
+        mock_model.generate_content.return_value.text = ""
+        mock_model_class.return_value = mock_model
+        
+        result = _call_gemini_api("Zone A", 150, 45, 0.55, "Moderate", "test_key")
+        
+        assert isinstance(result, str)
+        assert "Zone A has a Moderate risk level" in result
+    
     @pytest.mark.skipif(not OPENAI_AVAILABLE, reason="openai not installed")
     @patch('openai.OpenAI')
     def test_openai_api_success(self, mock_openai_class):
@@ -115,6 +152,24 @@ class TestGenerateExplanation:
             
             assert result == "Zone B has high pollution levels requiring attention."
     
+    @pytest.mark.skipif(not OPENAI_AVAILABLE, reason="openai not installed")
+    @patch('openai.OpenAI')
+    def test_openai_client_reused(self, mock_openai_class):
+        """Test that the OpenAI client is built once and reused across calls."""
+        mock_client = MagicMock()
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "Explanation."
+        mock_client.chat.completions.create.return_value = mock_response
+        mock_openai_class.return_value = mock_client
+        
+        with patch.dict(os.environ, {'OPENAI_API_KEY': 'test_key'}):
+            generate_explanation("Zone A", 150, 45, 0.55, "Moderate")
+            generate_explanation("Zone B", 200, 60, 0.70, "High")
+        
+        mock_openai_class.assert_called_once_with(api_key='test_key', timeout=10.0)
+        assert mock_client.chat.completions.create.call_count == 2
+    
     @pytest.mark.skipif(not OPENAI_AVAILABLE, reason="openai not installed")
     @patch('openai.OpenAI')
     def test_openai_api_failure_fallback(self, mock_openai_class):
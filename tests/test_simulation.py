@@ -3,7 +3,9 @@ Unit tests for simulation module.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
+import stress_engine
 from simulation import simulate_waste_reduction
 
 
@@ -195,6 +197,19 @@ class TestRecalculateStress:
         assert 'risk_level' in result.columns
         assert isinstance(result['stress_score'].iloc[0], float)
         assert result['risk_level'].iloc[0] in ['Low', 'Moderate', 'High']
+    
+    def test_empty_dataframe(self):
+        """Test that an empty dataframe passes through with empty result columns."""
+        df = pd.DataFrame({
+            'zone': pd.Series([], dtype=str),
+            'AQI': pd.Series([], dtype=float),
+            'waste_index': pd.Series([], dtype=float),
+            'temperature': pd.Series([], dtype=float)
+        })
+        result = recalculate_stress(df)
+        assert len(result) == 0
+        assert 'stress_score' in result.columns
+        assert 'risk_level' in result.columns
 
 
 
@@ -306,3 +321,140 @@ class TestSimulationApplicationLogic:
         # Verify that risk levels are calculated
         assert simulated_df1['risk_level'].isin(['Low', 'Moderate', 'High']).all()
         assert simulated_df2['risk_level'].isin(['Low', 'Moderate', 'High']).all()
+
+
+from simulation import apply_policies
+
+
+class TestApplyPolicies:
+    """Tests for the apply_policies() function."""
+    
+    def test_matches_simulation_chain(self):
+        """Test that the fused pass matches simulate_* followed by recalculate_stress."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [200, 150, 100],
+            'waste_index': [60, 40, 30],
+            'temperature': [30, 25, 20],
+            'humidity': [50, 60, 70]
+        })
+        expected = recalculate_stress(
+            simulate_emission_control(simulate_waste_reduction(df, 20), 30)
+        )
+        result = apply_policies(df, 20, 30)
+        
+        assert result.columns.tolist() == expected.columns.tolist()
+        assert result['AQI'].tolist() == expected['AQI'].tolist()
+        assert result['waste_index'].tolist() == expected['waste_index'].tolist()
+        assert result['stress_score'].tolist() == pytest.approx(expected['stress_score'].tolist())
+        assert result['risk_level'].tolist() == expected['risk_level'].tolist()
+    
+    def test_does_not_modify_original(self):
+        """Test that the original dataframe is not modified."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B'],
+            'AQI': [200, 150],
+            'waste_index': [60, 40],
+            'temperature': [30, 25]
+        })
+        apply_policies(df, 50, 50)
+        assert df.columns.tolist() == ['zone', 'AQI', 'waste_index', 'temperature']
+        assert df['AQI'].tolist() == [200, 150]
+        assert df['waste_index'].tolist() == [60, 40]
+    
+    def test_missing_value_matches_simulation_chain(self):
+        """Test that a NaN reading only affects its own zone, as in the unfused chain."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [200, float('nan'), 100],
+            'waste_index': [60, 40, 30],
+            'temperature': [30, 25, 20]
+        })
+        expected = recalculate_stress(
+            simulate_emission_control(simulate_waste_reduction(df, 20), 30)
+        )
+        result = apply_policies(df, 20, 30)
+        
+        assert result['stress_score'].isna().tolist() == [False, True, False]
+        assert result['stress_score'].tolist() == pytest.approx(expected['stress_score'].tolist(), nan_ok=True)
+    
+    def test_uses_stress_weights(self, monkeypatch):
+        """Test that the fused pass follows STRESS_WEIGHTS like recalculate_stress."""
+        monkeypatch.setattr(stress_engine, 'STRESS_WEIGHTS', np.array([0.2, 0.2, 0.6]))
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [200, 150, 100],
+            'waste_index': [60, 40, 30],
+            'temperature': [30, 25, 20]
+        })
+        expected = recalculate_stress(
+            simulate_emission_control(simulate_waste_reduction(df, 20), 30)
+        )
+        result = apply_policies(df, 20, 30)
+        assert result['stress_score'].tolist() == pytest.approx(expected['stress_score'].tolist())
+
+
+from simulation import precompute_stress_grid
+
+
+class TestPrecomputeStressGrid:
+    """Tests for the precompute_stress_grid() function."""
+    
+    def test_grid_shape(self):
+        """Test that the grid covers every slider combination for every zone."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [200, 150, 100],
+            'waste_index': [60, 40, 30],
+            'temperature': [30, 25, 20]
+        })
+        grid = precompute_stress_grid(df)
+        assert grid.shape == (101, 101, 3)
+        assert (grid >= 0).all()
+        assert (grid <= 1).all()
+    
+    def test_matches_simulation_chain(self):
+        """Test that grid slices match simulate_* followed by recalculate_stress."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [200, 150, 100],
+            'waste_index': [60, 40, 30],
+            'temperature': [30, 25, 20]
+        })
+        grid = precompute_stress_grid(df)
+        
+        for waste_reduction, emission_control in [(0, 0), (20, 30), (100, 0), (0, 100), (100, 100)]:
+            simulated_df = simulate_waste_reduction(df, waste_reduction)
+            simulated_df = simulate_emission_control(simulated_df, emission_control)
+            simulated_df = recalculate_stress(simulated_df)
+            
+            assert grid[waste_reduction, emission_control].tolist() == pytest.approx(
+                simulated_df['stress_score'].tolist()
+            )
+    
+    def test_clamps_like_simulation_chain(self):
+        """Test that out-of-range inputs are clamped to zero as in simulate_*."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [200, -50, 100],
+            'waste_index': [60, 40, -10],
+            'temperature': [30, 25, 20]
+        })
+        grid = precompute_stress_grid(df)
+        
+        simulated_df = recalculate_stress(simulate_emission_control(simulate_waste_reduction(df, 20), 30))
+        assert grid[20, 30].tolist() == pytest.approx(simulated_df['stress_score'].tolist())
+    
+    def test_uses_stress_weights(self, monkeypatch):
+        """Test that the grid follows STRESS_WEIGHTS like calculate_stress_score()."""
+        monkeypatch.setattr(stress_engine, 'STRESS_WEIGHTS', np.array([0.2, 0.2, 0.6]))
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [200, 150, 100],
+            'waste_index': [60, 40, 30],
+            'temperature': [30, 25, 20]
+        })
+        grid = precompute_stress_grid(df)
+        
+        simulated_df = recalculate_stress(simulate_emission_control(simulate_waste_reduction(df, 20), 30))
+        assert grid[20, 30].tolist() == pytest.approx(simulated_df['stress_score'].tolist())
@@ -3,8 +3,12 @@ Unit tests for stress_engine module.
 """
 
 import pytest
+import numpy as np
 import pandas as pd
-from stress_engine import normalize, calculate_stress_score, classify_risk
+import stress_engine
+from stress_engine import normalize, calculate_stress_score, classify_risk, classify_risk_series, classify_risk_batch, add_risk_level, NormCache, StressFrame
+from stress_engine import precompute_norm_params, apply_stress_score, calculate_stress_score_batch
+from simulation import simulate_waste_reduction, simulate_emission_control
 
 
 class TestClassifyRisk:
@@ -46,6 +50,82 @@ class TestClassifyRisk:
         assert isinstance(classify_risk(0.9), str)
 
 
+class TestClassifyRiskSeries:
+    """Tests for the classify_risk_series() function."""
+    
+    def test_matches_scalar_classification(self):
+        """Test that vectorized classification matches classify_risk() row by row."""
+        scores = pd.Series([0.0, 0.2, 0.3999, 0.4, 0.5, 0.7, 0.7001, 0.9, 1.0])
+        result = classify_risk_series(scores)
+        assert result.tolist() == scores.apply(classify_risk).tolist()
+    
+    def test_returns_categorical(self):
+        """Test that risk levels are categorical with the three known levels."""
+        result = classify_risk_series(pd.Series([0.2, 0.5, 0.9]))
+        assert isinstance(result.dtype, pd.CategoricalDtype)
+        assert result.cat.categories.tolist() == ['Low', 'Moderate', 'High']
+    
+    def test_categorical_comparisons(self):
+        """Test that label equality and ordered comparisons work on the categorical."""
+        df = pd.DataFrame({'stress_score': [0.2, 0.5, 0.9]})
+        df['risk_level'] = classify_risk_series(df['stress_score'])
+        assert df['risk_level'].dtype.name == 'category'
+        assert df['risk_level'].cat.ordered
+        assert (df['risk_level'] == 'High').tolist() == [False, False, True]
+        assert (df['risk_level'] >= 'Moderate').tolist() == [False, True, True]
+    
+    def test_preserves_index(self):
+        """Test that the result is aligned to the input index."""
+        scores = pd.Series([0.2, 0.9], index=[5, 7])
+        result = classify_risk_series(scores)
+        assert result.index.tolist() == [5, 7]
+
+
+class TestClassifyRiskBatch:
+    """Tests for the classify_risk_batch() function."""
+    
+    def test_matches_scalar_classification(self):
+        """Test that batch classification matches classify_risk() at the boundaries."""
+        scores = [0.0, 0.3999, 0.4, 0.5, 0.7, 0.7000001, 1.0]
+        result = classify_risk_batch(np.array(scores))
+        assert isinstance(result, pd.Categorical)
+        assert result.tolist() == [classify_risk(score) for score in scores]
+    
+    def test_missing_score_matches_scalar(self):
+        """Test that a NaN score gets the same label as classify_risk(nan)."""
+        scores = [0.2, np.nan, 0.5]
+        assert classify_risk_batch(scores).tolist() == [classify_risk(score) for score in scores]
+    
+    def test_missing_reading_does_not_relabel_other_zones(self):
+        """Test that one missing reading leaves the other zones' risk levels intact."""
+        df = pd.DataFrame({
+            'AQI': [100, np.nan, 300, 200],
+            'waste_index': [20, 50, 90, 60],
+            'temperature': [15, 25, 40, 30]
+        })
+        result = add_risk_level(calculate_stress_score(df))
+        assert result['risk_level'].tolist() == result['stress_score'].apply(classify_risk).tolist()
+        assert result['risk_level'].tolist() == ['Low', 'High', 'High', 'Moderate']
+
+
+class TestAddRiskLevel:
+    """Tests for the add_risk_level() function."""
+    
+    def test_matches_apply_classify_risk(self):
+        """Test equivalence with .apply(classify_risk) on random scores."""
+        rng = np.random.default_rng(42)
+        df = pd.DataFrame({'stress_score': rng.random(10_000)})
+        result = add_risk_level(df)
+        assert 'risk_level' not in df.columns
+        assert result['risk_level'].tolist() == df['stress_score'].apply(classify_risk).tolist()
+    
+    def test_custom_column_names(self):
+        """Test that the source and output columns can be renamed."""
+        df = pd.DataFrame({'score': [0.1, 0.95]})
+        result = add_risk_level(df, col='score', out='level')
+        assert result['level'].tolist() == ['Low', 'High']
+
+
 class TestNormalize:
     """Tests for the normalize() function."""
     
@@ -62,6 +142,20 @@ class TestNormalize:
         result = normalize(series)
         expected = pd.Series([0.0, 0.0, 0.0])
         pd.testing.assert_series_equal(result, expected)
+    
+    def test_missing_values(self):
+        """Test that NaN is skipped for min/max and only that element stays NaN."""
+        result = normalize(pd.Series([1, np.nan, 3]))
+        pd.testing.assert_series_equal(result, pd.Series([0.0, np.nan, 1.0]))
+        
+        # A missing value in an otherwise identical series still maps to zero
+        result = normalize(pd.Series([5, np.nan, 5]))
+        pd.testing.assert_series_equal(result, pd.Series([0.0, 0.0, 0.0]))
+    
+    def test_empty_series(self):
+        """Test that an empty series normalizes to an empty float series."""
+        result = normalize(pd.Series([], dtype=float))
+        pd.testing.assert_series_equal(result, pd.Series([], dtype=float))
 
 
 class TestCalculateStressScore:
@@ -90,6 +184,19 @@ class TestCalculateStressScore:
         assert list(df.columns) == ['zone', 'AQI', 'waste_index', 'temperature']
         assert all(col in result.columns for col in df.columns)
     
+    def test_result_independent_of_input(self):
+        """Test that mutating the returned dataframe does not modify the input."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B'],
+            'AQI': [100, 200],
+            'waste_index': [30, 60],
+            'temperature': [20, 30]
+        })
+        result = calculate_stress_score(df)
+        result.iloc[0, result.columns.get_loc('AQI')] = 999
+        assert df['AQI'].tolist() == [100, 200]
+        assert 'stress_score' not in df.columns
+    
     def test_stress_score_in_valid_range(self):
         """Test that stress scores are in [0, 1] range."""
         df = pd.DataFrame({
@@ -101,3 +208,332 @@ class TestCalculateStressScore:
         result = calculate_stress_score(df)
         assert (result['stress_score'] >= 0).all()
         assert (result['stress_score'] <= 1).all()
+    
+    @pytest.mark.skipif(not stress_engine.NUMBA_AVAILABLE, reason="numba not installed")
+    def test_numba_kernel_matches_numpy(self, monkeypatch):
+        """Test that the Numba kernel used for large frames matches the NumPy path."""
+        rng = np.random.default_rng(0)
+        n = stress_engine.NUMBA_MIN_ROWS
+        df = pd.DataFrame({
+            'AQI': rng.integers(50, 301, size=n),
+            'waste_index': rng.integers(20, 91, size=n),
+            'temperature': rng.uniform(15, 40, size=n)
+        })
+        kernel_result = calculate_stress_score(df)
+        
+        monkeypatch.setattr(stress_engine, 'NUMBA_AVAILABLE', False)
+        numpy_result = calculate_stress_score(df)
+        
+        np.testing.assert_allclose(
+            kernel_result['stress_score'].to_numpy(),
+            numpy_result['stress_score'].to_numpy(),
+            rtol=1e-12, atol=1e-12
+        )
+    
+    @pytest.mark.skipif(not stress_engine.NUMBA_AVAILABLE, reason="numba not installed")
+    def test_numba_kernel_weights_match_stress_weights(self):
+        """Test that the weights baked into the Numba kernel equal STRESS_WEIGHTS."""
+        # Each of rows 1-3 is at the maximum of exactly one factor and the
+        # minimum of the others, so its score is that factor's weight
+        aqi = np.array([0.0, 1.0, 0.0, 0.0])
+        waste = np.array([0.0, 0.0, 1.0, 0.0])
+        temp = np.array([0.0, 0.0, 0.0, 1.0])
+        out = np.empty(4)
+        stress_engine._stress_kernel(aqi, waste, temp, out)
+        np.testing.assert_allclose(out[1:], stress_engine.STRESS_WEIGHTS, rtol=0, atol=1e-15)
+    
+    @pytest.mark.skipif(not stress_engine.POLARS_AVAILABLE, reason="polars not installed")
+    def test_polars_path_matches_numpy(self, monkeypatch):
+        """Test that the Polars path used for very large frames matches the NumPy path."""
+        rng = np.random.default_rng(0)
+        n = stress_engine.POLARS_MIN_ROWS + 1
+        df = pd.DataFrame({
+            'zone': [f"Zone {i}" for i in range(n)],
+            'AQI': rng.integers(50, 301, size=n),
+            'waste_index': np.full(n, 40),
+            'temperature': rng.uniform(15, 40, size=n)
+        }, index=np.arange(n) * 2)
+        polars_result = calculate_stress_score(df)
+        
+        monkeypatch.setattr(stress_engine, 'POLARS_AVAILABLE', False)
+        monkeypatch.setattr(stress_engine, 'NUMBA_AVAILABLE', False)
+        numpy_result = calculate_stress_score(df)
+        
+        assert polars_result.index.equals(df.index)
+        assert polars_result['zone'].tolist() == df['zone'].tolist()
+        np.testing.assert_allclose(
+            polars_result['stress_score'].to_numpy(),
+            numpy_result['stress_score'].to_numpy(),
+            rtol=1e-12, atol=1e-12
+        )
+    
+    def test_missing_values_agree_across_paths(self, monkeypatch):
+        """Test that NaN rows score the same on the NumPy, Numba and Polars paths."""
+        rng = np.random.default_rng(0)
+        n = stress_engine.POLARS_MIN_ROWS + 1
+        df = pd.DataFrame({
+            'AQI': rng.uniform(50, 300, size=n),
+            'waste_index': rng.uniform(20, 90, size=n),
+            'temperature': np.full(n, 25.0)
+        })
+        df.loc[3, 'AQI'] = np.nan
+        df.loc[5, 'waste_index'] = np.nan
+        # A missing value in the constant temperature column contributes 0
+        df.loc[7, 'temperature'] = np.nan
+        
+        results = {}
+        if stress_engine.POLARS_AVAILABLE:
+            results['polars'] = calculate_stress_score(df)['stress_score'].to_numpy()
+        monkeypatch.setattr(stress_engine, 'POLARS_AVAILABLE', False)
+        if stress_engine.NUMBA_AVAILABLE:
+            results['numba'] = calculate_stress_score(df)['stress_score'].to_numpy()
+        monkeypatch.setattr(stress_engine, 'NUMBA_AVAILABLE', False)
+        expected = calculate_stress_score(df)['stress_score'].to_numpy()
+        
+        assert np.flatnonzero(np.isnan(expected)).tolist() == [3, 5]
+        for path, scores in results.items():
+            np.testing.assert_allclose(scores, expected, rtol=1e-12, atol=1e-12, err_msg=path)
+    
+    def test_missing_value_only_affects_its_row(self):
+        """Test that a NaN reading gives a NaN score for that row only."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [1, np.nan, 3],
+            'waste_index': [1, 2, 3],
+            'temperature': [1, 2, 3]
+        })
+        result = calculate_stress_score(df)['stress_score']
+        assert result[0] == 0.0
+        assert np.isnan(result[1])
+        assert result[2] == pytest.approx(1.0)
+    
+    def test_missing_value_in_constant_column(self):
+        """Test that a NaN in an otherwise constant column contributes 0, as normalize() does."""
+        df = pd.DataFrame({
+            'AQI': [100, 200, 150],
+            'waste_index': [50, np.nan, 50],
+            'temperature': [20, 30, 25]
+        })
+        result = calculate_stress_score(df)['stress_score']
+        assert result.tolist() == pytest.approx([0.0, 0.7, 0.35])
+    
+    def test_empty_dataframe(self):
+        """Test that an empty frame returns an empty stress_score column."""
+        df = pd.DataFrame({
+            'zone': pd.Series([], dtype=str),
+            'AQI': pd.Series([], dtype=float),
+            'waste_index': pd.Series([], dtype=float),
+            'temperature': pd.Series([], dtype=float)
+        })
+        result = calculate_stress_score(df)
+        assert len(result) == 0
+        assert 'stress_score' in result.columns
+        assert result['stress_score'].dtype == np.float64
+    
+    def test_all_constant_columns(self):
+        """Test that a frame with no variation in any factor scores zero."""
+        df = pd.DataFrame({
+            'zone': ['Zone A'],
+            'AQI': [150],
+            'waste_index': [50],
+            'temperature': [25]
+        })
+        result = calculate_stress_score(df)
+        assert result['stress_score'].tolist() == [0.0]
+        assert result['stress_score'].dtype == np.float64
+    
+    def test_float32_matches_float64(self):
+        """Test that the opt-in float32 calculation agrees with float64."""
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({
+            'AQI': rng.integers(50, 300, 500),
+            'waste_index': rng.uniform(20, 90, 500),
+            'temperature': rng.uniform(15, 40, 500)
+        })
+        result = calculate_stress_score(df, dtype=np.float32)
+        expected = calculate_stress_score(df)
+        assert result['stress_score'].dtype == np.float32
+        np.testing.assert_allclose(result['stress_score'], expected['stress_score'], atol=1e-6)
+
+
+class TestPrecomputedNormParams:
+    """Tests for precompute_norm_params() and apply_stress_score()."""
+    
+    def test_matches_calculate_stress_score(self):
+        """Test that applying a frame's own parameters reproduces its scores."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [100, 200, 150],
+            'waste_index': [30, 60, 45],
+            'temperature': [20, 30, 25]
+        })
+        result = apply_stress_score(df, precompute_norm_params(df))
+        pd.testing.assert_frame_equal(result, calculate_stress_score(df))
+    
+    def test_reference_parameters(self):
+        """Test scoring new readings against a reference frame's ranges."""
+        reference = pd.DataFrame({
+            'AQI': [100, 200],
+            'waste_index': [30, 60],
+            'temperature': [20, 30]
+        })
+        readings = pd.DataFrame({'AQI': [150], 'waste_index': [60], 'temperature': [20]})
+        result = apply_stress_score(readings, precompute_norm_params(reference))
+        assert result['stress_score'].iloc[0] == pytest.approx(0.5 * 0.5 + 0.3 * 1.0 + 0.2 * 0.0)
+
+
+class TestCalculateStressScoreBatch:
+    """Tests for the calculate_stress_score_batch() function."""
+    
+    def test_matches_per_snapshot_calculation(self):
+        """Test that each batch row matches calculate_stress_score() on that snapshot."""
+        rng = np.random.default_rng(7)
+        tensor = np.stack([
+            rng.integers(50, 300, (4, 20)),
+            rng.integers(20, 90, (4, 20)),
+            rng.integers(15, 40, (4, 20))
+        ], axis=-1)
+        # One snapshot with a constant factor exercises the zero-range guard
+        tensor[2, :, 2] = 25
+        
+        result = calculate_stress_score_batch(tensor)
+        assert result.shape == (4, 20)
+        for i, snapshot in enumerate(tensor):
+            df = pd.DataFrame(snapshot, columns=['AQI', 'waste_index', 'temperature'])
+            np.testing.assert_allclose(result[i], calculate_stress_score(df)['stress_score'], atol=1e-12)
+
+
+class TestNormCache:
+    """Tests for reusing min/max statistics via NormCache."""
+    
+    def test_cached_scores_match_uncached(self):
+        """Test that passing a cache does not change the stress scores."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [100, 200, 150],
+            'waste_index': [30, 60, 45],
+            'temperature': [20, 30, 25]
+        })
+        cache = NormCache()
+        expected = calculate_stress_score(df)['stress_score'].tolist()
+        assert calculate_stress_score(df, cache=cache)['stress_score'].tolist() == expected
+        assert calculate_stress_score(df, cache=cache)['stress_score'].tolist() == expected
+    
+    @pytest.mark.skipif(
+        not stress_engine._copy_on_write_enabled(),
+        reason="without copy-on-write, assign() copies every column so nothing is shared"
+    )
+    def test_reuses_unchanged_columns(self):
+        """Test that only the column changed by a simulation is recomputed."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [100, 200, 150],
+            'waste_index': [30, 60, 45],
+            'temperature': [20.0, 30.0, 25.0]
+        })
+        cache = NormCache()
+        calculate_stress_score(df, cache=cache)
+        assert len(cache) == 3
+        
+        simulated_df = simulate_waste_reduction(df, 50)
+        result = calculate_stress_score(simulated_df, cache=cache)
+        assert len(cache) == 4
+        assert result['stress_score'].tolist() == pytest.approx(
+            calculate_stress_score(simulated_df)['stress_score'].tolist()
+        )
+    
+    def test_in_place_edit_misses_cache(self):
+        """Test that editing a cached column in place does not reuse stale statistics."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [100, 200, 150],
+            'waste_index': [30, 60, 45],
+            'temperature': [20.0, 30.0, 25.0]
+        })
+        cache = NormCache()
+        calculate_stress_score(df, cache=cache)
+        
+        df.loc[0, 'AQI'] = 500
+        result = calculate_stress_score(df, cache=cache)
+        assert result['stress_score'].tolist() == pytest.approx(
+            calculate_stress_score(df)['stress_score'].tolist()
+        )
+        assert (result['stress_score'] <= 1).all()
+    
+    def test_in_place_buffer_write_without_copy_on_write(self, monkeypatch):
+        """Test that a write straight into a cached buffer is caught when copy-on-write is off."""
+        monkeypatch.setattr(stress_engine, '_copy_on_write_enabled', lambda: False)
+        df = pd.DataFrame({
+            'AQI': [100.0, 200.0, 150.0],
+            'waste_index': [30.0, 60.0, 45.0],
+            'temperature': [20.0, 30.0, 25.0]
+        })
+        cache = NormCache()
+        calculate_stress_score(df, cache=cache)
+        
+        # Mutate the column's buffer in place, as pandas 2 does for df.loc
+        # without copy-on-write, so its address stays the same
+        values = df['AQI'].to_numpy()
+        values.setflags(write=True)
+        values[0] = 500.0
+        
+        result = calculate_stress_score(df, cache=cache)
+        assert result['stress_score'].tolist() == pytest.approx(
+            calculate_stress_score(df)['stress_score'].tolist()
+        )
+    
+    def test_nullable_columns_with_missing_values(self):
+        """Test that nullable columns with NA are never served another column's statistics."""
+        rng = np.random.default_rng(0)
+        cache = NormCache()
+        for _ in range(50):
+            df = pd.DataFrame({
+                'AQI': rng.integers(50, 300, 20),
+                'waste_index': rng.integers(20, 90, 20),
+                'temperature': rng.integers(15, 40, 20)
+            }).astype('Float64')
+            df.loc[3, 'AQI'] = pd.NA
+            
+            result = calculate_stress_score(df, cache=cache)['stress_score']
+            expected = calculate_stress_score(df)['stress_score']
+            np.testing.assert_allclose(
+                result.to_numpy(dtype=np.float64, na_value=np.nan),
+                expected.to_numpy(dtype=np.float64, na_value=np.nan)
+            )
+
+
+class TestStressFrame:
+    """Tests for the StressFrame block representation."""
+    
+    def test_scores_match_dataframe_path(self):
+        """Test that the block scores match calculate_stress_score()."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [100, 200, 150],
+            'waste_index': [30, 60, 45],
+            'temperature': [20, 30, 25]
+        })
+        frame = StressFrame(df)
+        assert frame.cols.dtype == np.float32
+        assert frame.cols.flags.c_contiguous
+        np.testing.assert_allclose(frame.stress_scores(), calculate_stress_score(df)['stress_score'], atol=1e-6)
+    
+    def test_in_place_policies_match_simulation(self):
+        """Test that the in-place reductions match the simulate_* functions."""
+        df = pd.DataFrame({
+            'zone': ['Zone A', 'Zone B', 'Zone C'],
+            'AQI': [100, 200, 150],
+            'waste_index': [30, 60, 45],
+            'temperature': [20, 35, 25]
+        })
+        frame = StressFrame(df, dtype=np.float64)
+        frame.reduce_waste(40)
+        frame.reduce_emissions(25)
+        result = frame.to_frame()
+        
+        expected = calculate_stress_score(simulate_emission_control(simulate_waste_reduction(df, 40), 25))
+        assert result['zone'].tolist() == df['zone'].tolist()
+        np.testing.assert_allclose(result['AQI'], expected['AQI'])
+        np.testing.assert_allclose(result['waste_index'], expected['waste_index'])
+        np.testing.assert_allclose(result['stress_score'], expected['stress_score'])
+        assert result['risk_level'].tolist() == expected['stress_score'].apply(classify_risk).tolist()